@@ -8,6 +8,7 @@ from sqlalchemy.engine.url import make_url
 
 from alembic import context
 from app.db.base import Base
+import app.models  # noqa: F401  (registers tables on Base.metadata)
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -47,6 +48,16 @@ config.set_main_option(
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+
+def include_object(obj, name, type_, reflected, compare_to):
+    # The FTS5 index, its shadow tables and the meta table are managed by
+    # app.main.migrate_schema.
+    if type_ == "table" and reflected and name:
+        if name == "meta" or name.startswith("entries_fts"):
+            return False
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -71,6 +82,8 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
+        render_as_batch=make_url(url).drivername.startswith("sqlite"),
     )
 
     with context.begin_transaction():
@@ -91,7 +104,14 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        # SQLite can't ALTER most columns in place; batch mode lets autogenerate
+        # emit one copy-and-move per table instead of one rewrite per ALTER.
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
 
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,36 @@
+"""index open sessions
+
+Revision ID: 3b7e0c2d9a41
+Revises: fd9223a4e558
+Create Date: 2026-10-14 19:05:12.318406
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7e0c2d9a41"
+down_revision: Union[str, Sequence[str], None] = "fd9223a4e558"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_entries_open",
+        "entries",
+        ["client", "client_key", "id"],
+        postgresql_where=sa.text("end_iso IS NULL"),
+        sqlite_where=sa.text("end_iso IS NULL"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_entries_open", table_name="entries")
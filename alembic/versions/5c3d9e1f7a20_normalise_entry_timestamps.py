@@ -0,0 +1,51 @@
+"""normalise entry timestamps
+
+Revision ID: 5c3d9e1f7a20
+Revises: 3b7e0c2d9a41
+Create Date: 2026-10-15 09:41:26.503918
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.timezone import central_iso
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c3d9e1f7a20"
+down_revision: Union[str, Sequence[str], None] = "3b7e0c2d9a41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Data only: listings compare start_iso as text, so rewrite timestamps that
+    # older builds stored with other offsets into Central time.
+    if op.get_context().as_sql:
+        # Needs the rows themselves; there is no SQL to emit in --sql mode.
+        return
+    conn = op.get_bind()
+    changed = []
+    for entry_id, start_iso, end_iso in conn.execute(
+        sa.text("SELECT id, start_iso, end_iso FROM entries")
+    ).all():
+        new_start, new_end = central_iso(start_iso), central_iso(end_iso)
+        if new_start != start_iso or new_end != end_iso:
+            changed.append({"id": entry_id, "start_iso": new_start, "end_iso": new_end})
+    if changed:
+        conn.execute(
+            sa.text(
+                "UPDATE entries SET start_iso = :start_iso, end_iso = :end_iso"
+                " WHERE id = :id"
+            ),
+            changed,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The original offsets aren't recorded; the rewritten values stay.
@@ -0,0 +1,69 @@
+"""rounded_hours numeric
+
+Revision ID: 8a1f4c6e2b07
+Revises: c5e1159a2625
+Create Date: 2026-10-14 21:12:47.905113
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8a1f4c6e2b07"
+down_revision: Union[str, Sequence[str], None] = "c5e1159a2625"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The text default can't be cast in place on PostgreSQL, so drop it around
+    # the type change.
+    with op.batch_alter_table("entries") as batch_op:
+        batch_op.alter_column(
+            "rounded_hours",
+            existing_type=sa.Text(),
+            existing_nullable=False,
+            server_default=None,
+        )
+        batch_op.alter_column(
+            "rounded_hours",
+            type_=sa.Numeric(10, 2),
+            existing_type=sa.Text(),
+            existing_nullable=False,
+            postgresql_using="rounded_hours::numeric(10,2)",
+        )
+        batch_op.alter_column(
+            "rounded_hours",
+            existing_type=sa.Numeric(10, 2),
+            existing_nullable=False,
+            server_default=sa.text("0.00"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("entries") as batch_op:
+        batch_op.alter_column(
+            "rounded_hours",
+            existing_type=sa.Numeric(10, 2),
+            existing_nullable=False,
+            server_default=None,
+        )
+        batch_op.alter_column(
+            "rounded_hours",
+            type_=sa.Text(),
+            existing_type=sa.Numeric(10, 2),
+            existing_nullable=False,
+            postgresql_using="to_char(rounded_hours, 'FM999999990.00')",
+        )
+        batch_op.alter_column(
+            "rounded_hours",
+            existing_type=sa.Text(),
+            existing_nullable=False,
+            server_default="0.00",
+        )
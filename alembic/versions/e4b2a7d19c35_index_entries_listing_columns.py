@@ -0,0 +1,48 @@
+"""index entries listing columns
+
+Revision ID: e4b2a7d19c35
+Revises: 8a1f4c6e2b07
+Create Date: 2026-10-14 21:20:03.117842
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b2a7d19c35"
+down_revision: Union[str, Sequence[str], None] = "8a1f4c6e2b07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # On SQLite, app.main.migrate_schema may have created these already.
+    op.create_index(
+        "ix_entries_client_key", "entries", ["client_key"], if_not_exists=True
+    )
+    op.create_index(
+        "ix_entries_completed_start",
+        "entries",
+        ["completed", "start_iso"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_entries_invoice",
+        "entries",
+        ["invoice_number"],
+        postgresql_where=sa.text("invoice_number IS NOT NULL"),
+        sqlite_where=sa.text("invoice_number IS NOT NULL"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_entries_invoice", table_name="entries")
+    op.drop_index("ix_entries_completed_start", table_name="entries")
+    op.drop_index("ix_entries_client_key", table_name="entries")
@@ -0,0 +1,30 @@
+"""index entries start_iso
+
+Revision ID: fd9223a4e558
+Revises: e4b2a7d19c35
+Create Date: 2026-10-14 18:50:22.641340
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "fd9223a4e558"
+down_revision: Union[str, Sequence[str], None] = "e4b2a7d19c35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_entries_start_iso", "entries", ["start_iso"], if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_entries_start_iso", table_name="entries")
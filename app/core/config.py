@@ -1,8 +1,17 @@
+import json
+import re
 from functools import lru_cache
-from typing import List, Sequence
+from typing import Annotated, Sequence, Tuple
 
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict  # type: ignore[import-not-found]
+from pydantic_settings import (  # type: ignore[import-not-found]
+    BaseSettings,
+    NoDecode,
+    SettingsConfigDict,
+)
+
+
+_CSV_SPLIT = re.compile(r"\s*,\s*")
 
 
 class Settings(BaseSettings):
@@ -19,23 +28,33 @@ class Settings(BaseSettings):
     external_url: str | None = Field(default=None, alias="EXTERNAL_URL")
     api_token: str = Field(default="", alias="API_TOKEN")
     db_url: str = Field(default="sqlite:///./data/data.db", alias="DB_URL")
-    allowed_hosts: List[str] = Field(
-        default_factory=lambda: ["localhost", "127.0.0.1"], alias="ALLOWED_HOSTS"
+    db_pool_size: int = Field(default=10, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=20, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: int = Field(default=30, alias="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(default=1800, alias="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(default=True, alias="DB_POOL_PRE_PING")
+    db_echo_pool: bool = Field(default=False, alias="DB_ECHO_POOL")
+    # NoDecode: hand the raw env string to _split_str instead of json.loads-ing
+    # it first (which also rejected the documented comma-separated form).
+    allowed_hosts: Annotated[Tuple[str, ...], NoDecode] = Field(
+        default=("localhost", "127.0.0.1"), alias="ALLOWED_HOSTS"
     )
-    cors_origins: List[str] = Field(
-        default_factory=lambda: ["http://localhost:9444"], alias="CORS_ORIGINS"
+    cors_origins: Annotated[Tuple[str, ...], NoDecode] = Field(
+        default=("http://localhost:9444",), alias="CORS_ORIGINS"
     )
 
     @field_validator("allowed_hosts", "cors_origins", mode="before")
     @classmethod
-    def _split_str(cls, value: Sequence[str] | str | None) -> List[str]:
+    def _split_str(cls, value: Sequence[str] | str | None) -> Tuple[str, ...]:
         if value is None:
-            return []
+            return ()
+        if isinstance(value, str) and value.lstrip().startswith("["):
+            value = json.loads(value)
         if isinstance(value, (list, tuple, set)):
-            return [str(v).strip() for v in value if str(v).strip()]
-        return [item.strip() for item in str(value).split(",") if item.strip()]
+            return tuple(item for item in map(str.strip, map(str, value)) if item)
+        return tuple(item for item in _CSV_SPLIT.split(str(value).strip()) if item)
 
 
-@lru_cache()
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
     return Settings()
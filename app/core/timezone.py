@@ -1,6 +1,35 @@
+from datetime import datetime
+from typing import Callable, Optional
 from zoneinfo import ZoneInfo
 
+_parse_datetime: Callable[[str], datetime]
+try:  # C-accelerated ISO-8601 parsing when available
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:  # pragma: no cover
+    _parse_datetime = datetime.fromisoformat
+
 
 CENTRAL = ZoneInfo("America/Chicago")
 
-__all__ = ["CENTRAL"]
+
+def parse_iso(s: str) -> datetime:
+    try:
+        dt = _parse_datetime(s)
+    except ValueError:
+        # ciso8601 is stricter than fromisoformat on 3.11+, which also takes
+        # e.g. "2025-01-03T1000" or a space before the offset.
+        dt = datetime.fromisoformat(s)
+    return dt.astimezone(CENTRAL)
+
+
+def central_iso(s: Optional[str]) -> Optional[str]:
+    """``parse_iso(s).isoformat()``, or ``s`` unchanged when it doesn't parse."""
+    if not s:
+        return s
+    try:
+        return parse_iso(s).isoformat()
+    except (ValueError, OverflowError):
+        return s
+
+
+__all__ = ["CENTRAL", "central_iso", "parse_iso"]
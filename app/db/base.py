@@ -5,7 +5,4 @@ class Base(DeclarativeBase):
     pass
 
 
-# Ensure models are imported for Alembic's autogeneration.
-import app.models.entry  # noqa: E402,F401
-
 __all__ = ["Base"]
@@ -1,50 +1,127 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Mapping, Sequence
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
-from sqlalchemy.engine.url import make_url
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import Table, create_engine, event, insert
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.engine.url import URL, make_url
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.core.config import get_settings
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 _settings = get_settings()
+_ENSURED_DIRS: set[Path] = set()
 
 
-def _normalise_database_url(raw_url: str) -> str:
-    url = make_url(raw_url)
+def _normalise_database_url(url: URL) -> URL:
     drivername = url.drivername
     if drivername.startswith("sqlite+"):
         url = url.set(drivername="sqlite")
     elif "+" in drivername and drivername.startswith("postgresql+"):
         url = url.set(drivername="postgresql")
-    return str(url)
+    return url
 
 
-def _sqlite_connect_args(url: str) -> Dict[str, Any]:
-    if not url.startswith("sqlite"):
+def _sqlite_connect_args(url: URL) -> Dict[str, Any]:
+    if not url.drivername.startswith("sqlite"):
         return {}
     connect_args: Dict[str, Any] = {"check_same_thread": False}
     try:
-        url_obj = make_url(url)
-        db_path = url_obj.database
+        db_path = url.database
         if db_path and db_path != ":memory:":
             path = Path(db_path)
             if not path.is_absolute():
                 path = (BASE_DIR / db_path).resolve()
-            path.parent.mkdir(parents=True, exist_ok=True)
+            if path.parent not in _ENSURED_DIRS:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                _ENSURED_DIRS.add(path.parent)
     except Exception:
         pass
     return connect_args
 
 
-SYNC_DATABASE_URL = _normalise_database_url(_settings.db_url)
-_connect_args = _sqlite_connect_args(SYNC_DATABASE_URL)
-engine: Engine = create_engine(SYNC_DATABASE_URL, connect_args=_connect_args)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Parse DB_URL once; the helpers above and create_engine share the URL object.
+DATABASE_URL = _normalise_database_url(make_url(_settings.db_url))
+_backend = DATABASE_URL.get_backend_name()
+_connect_args = _sqlite_connect_args(DATABASE_URL)
+_db_path = DATABASE_URL.database
+# Room in the compiled-SQL cache for every statement shape the app issues
+# (filter/sort combinations multiply quickly); SQLAlchemy's default is 500.
+_engine_kwargs: Dict[str, Any] = {
+    "connect_args": _connect_args,
+    "query_cache_size": 1200,
+    "echo_pool": _settings.db_echo_pool,
+}
+if _backend == "postgresql":
+    _engine_kwargs.update(
+        pool_size=_settings.db_pool_size,
+        max_overflow=_settings.db_max_overflow,
+        pool_timeout=_settings.db_pool_timeout,
+        pool_recycle=_settings.db_pool_recycle,
+        pool_pre_ping=_settings.db_pool_pre_ping,
+    )
+elif _backend == "sqlite" and _db_path in (None, "", ":memory:"):
+    # Every new connection to an in-memory database is a fresh, empty
+    # database, so share a single connection across the process.
+    _engine_kwargs["poolclass"] = StaticPool
+engine: Engine = create_engine(DATABASE_URL, **_engine_kwargs)
 
-__all__ = ["engine", "SessionLocal"]
+
+def _minutes_to_hours(minutes: int | None) -> float | None:
+    return None if minutes is None else minutes / 60.0
+
+
+if _backend == "sqlite":
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn: Any, _: Any) -> None:
+        # WAL lets readers run alongside the writer; NORMAL sync drops the
+        # per-commit fsync of the main database file.
+        cur = dbapi_conn.cursor()
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA synchronous=NORMAL")
+        cur.execute("PRAGMA temp_store=MEMORY")
+        cur.execute("PRAGMA mmap_size=268435456")
+        cur.execute("PRAGMA cache_size=-65536")
+        cur.execute("PRAGMA foreign_keys=ON")
+        cur.close()
+        # Lets reports aggregate in SQL, e.g. SUM(to_hours(rounded_minutes)).
+        dbapi_conn.create_function("to_hours", 1, _minutes_to_hours, deterministic=True)
+
+
+# expire_on_commit=False: sessions are per-request, so objects stay valid after
+# commit without a reload SELECT before they're rendered or serialised.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
+
+
+def bulk_insert(
+    session: Session,
+    table: Table,
+    rows: Sequence[Mapping[str, Any]],
+    batch_size: int = 1000,
+) -> None:
+    """Insert ``rows`` with one executemany per batch instead of ORM adds."""
+    stmt = insert(table)
+    for i in range(0, len(rows), batch_size):
+        session.execute(stmt, list(rows[i : i + batch_size]))
+
+
+def fast_insert(
+    conn: Connection | Session,
+    table: Table,
+    rows: Sequence[Mapping[str, Any]],
+) -> List[int]:
+    """Core INSERT ... RETURNING id for ``rows``; ids come back in row order."""
+    if not rows:
+        return []
+    stmt = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+    return list(conn.execute(stmt, list(rows)).scalars())
+
+
+__all__ = ["engine", "SessionLocal", "bulk_insert", "fast_insert"]
@@ -1,10 +1,14 @@
 from __future__ import annotations
-from datetime import datetime, timedelta, date, time
+from datetime import datetime, timedelta, timezone, date, time
 import csv
 import io
-import json
 import os
 import re
+import sqlite3
+import threading
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
@@ -19,20 +23,28 @@ from fastapi import (
     File,
     Query,
 )
-from fastapi.responses import HTMLResponse, Response, RedirectResponse, JSONResponse
+from fastapi.responses import (
+    HTMLResponse,
+    Response,
+    RedirectResponse,
+    ORJSONResponse,
+    StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
+import orjson
 from prometheus_fastapi_instrumentator import Instrumentator
 from pydantic import BaseModel
-from sqlalchemy import or_, desc
+from sqlalchemy import column, desc, or_, select, table, update
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
-from app.core.timezone import CENTRAL
+from app.core.timezone import CENTRAL, central_iso, parse_iso
 from app.db.base import Base
-from app.db.session import SessionLocal, engine
+from app.db.session import SessionLocal, bulk_insert, engine, fast_insert
 from app.models import Entry
 
 # ---------- Config ----------
@@ -44,7 +56,7 @@ TEMPLATES_DIR = BASE_DIR / "app" / "templates"
 os.makedirs(DATA_DIR, exist_ok=True)
 
 settings = get_settings()
-app = FastAPI(title=settings.app_name)
+app = FastAPI(title=settings.app_name, default_response_class=ORJSONResponse)
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 templates = Jinja2Templates(directory=TEMPLATES_DIR)
 
@@ -77,11 +89,92 @@ async def health(_: Request) -> Dict[str, bool]:
 Base.metadata.create_all(engine)
 
 
+# ---------- Full-text search (SQLite FTS5, trigram) ----------
+# An external-content FTS5 index over the searchable columns, kept in sync by
+# triggers. The trigram tokenizer answers substring queries, so a MATCH gives the
+# same hits as LIKE '%q%' without scanning the table.
+_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5("
+    "client, client_key, note, invoice_number,"
+    " content='entries', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS entries_fts_ai AFTER INSERT ON entries BEGIN"
+    " INSERT INTO entries_fts(rowid, client, client_key, note, invoice_number)"
+    " VALUES (new.id, new.client, new.client_key, new.note, new.invoice_number);"
+    " END",
+    "CREATE TRIGGER IF NOT EXISTS entries_fts_ad AFTER DELETE ON entries BEGIN"
+    " INSERT INTO entries_fts(entries_fts, rowid, client, client_key, note,"
+    " invoice_number) VALUES ('delete', old.id, old.client, old.client_key,"
+    " old.note, old.invoice_number);"
+    " END",
+    "CREATE TRIGGER IF NOT EXISTS entries_fts_au"
+    " AFTER UPDATE OF client, client_key, note, invoice_number ON entries BEGIN"
+    " INSERT INTO entries_fts(entries_fts, rowid, client, client_key, note,"
+    " invoice_number) VALUES ('delete', old.id, old.client, old.client_key,"
+    " old.note, old.invoice_number);"
+    " INSERT INTO entries_fts(rowid, client, client_key, note, invoice_number)"
+    " VALUES (new.id, new.client, new.client_key, new.note, new.invoice_number);"
+    " END",
+)
+_entries_fts = table("entries_fts", column("rowid"), column("entries_fts"))
+_FTS_ENABLED = False
+
+
+def _ensure_entries_fts(conn: Connection) -> bool:
+    # trigram needs SQLite 3.34+; skip quietly where FTS5 isn't compiled in.
+    if sqlite3.sqlite_version_info < (3, 34, 0):
+        return False
+    if not conn.exec_driver_sql(
+        "SELECT sqlite_compileoption_used('ENABLE_FTS5')"
+    ).scalar():
+        return False
+    # Rebuilding entries (e.g. an Alembic batch migration) drops its triggers,
+    # and rows written meanwhile never reached the index: re-create and rebuild.
+    present = conn.exec_driver_sql(
+        "SELECT count(*) FROM sqlite_master WHERE name IN"
+        " ('entries_fts', 'entries_fts_ai', 'entries_fts_ad', 'entries_fts_au')"
+    ).scalar()
+    if present == len(_FTS_DDL):
+        return True
+    for ddl in _FTS_DDL:
+        conn.exec_driver_sql(ddl)
+    conn.exec_driver_sql("INSERT INTO entries_fts(entries_fts) VALUES ('rebuild')")
+    return True
+
+
 # ---------- Lite migration (adds missing cols on old DBs) ----------
+# Bump whenever migrate_schema gains a step, so existing databases run it once.
+_SCHEMA_VERSION = 2
+
+
+def _normalise_entry_timestamps(conn: Connection) -> None:
+    # Older builds stored imported/edited timestamps verbatim; listings filter
+    # on the text, so rewrite every parseable value in Central time.
+    changed = []
+    for entry_id, start_iso, end_iso in conn.exec_driver_sql(
+        "SELECT id, start_iso, end_iso FROM entries"
+    ).all():
+        new_start, new_end = central_iso(start_iso), central_iso(end_iso)
+        if new_start != start_iso or new_end != end_iso:
+            changed.append((new_start, new_end, entry_id))
+    if changed:
+        conn.exec_driver_sql(
+            "UPDATE entries SET start_iso = ?, end_iso = ? WHERE id = ?", changed
+        )
+
+
 def migrate_schema():
+    global _FTS_ENABLED
     if engine.dialect.name != "sqlite":
         return
     with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE IF NOT EXISTS meta (k TEXT PRIMARY KEY, v TEXT)"
+        )
+        meta = dict(conn.exec_driver_sql("SELECT k, v FROM meta").all())
+        if meta.get("schema_version") == str(_SCHEMA_VERSION):
+            if meta.get("fts") == "1":
+                _FTS_ENABLED = _ensure_entries_fts(conn)
+            return
         cols = {
             row[1] for row in conn.exec_driver_sql("PRAGMA table_info(entries)").all()
         }
@@ -95,7 +188,7 @@ def migrate_schema():
             )
         if "rounded_hours" not in cols:
             conn.exec_driver_sql(
-                "ALTER TABLE entries ADD COLUMN rounded_hours TEXT NOT NULL DEFAULT '0.00'"
+                "ALTER TABLE entries ADD COLUMN rounded_hours NUMERIC(10, 2) NOT NULL DEFAULT 0.00"
             )
         if "elapsed_minutes" not in cols:
             conn.exec_driver_sql(
@@ -119,51 +212,104 @@ def migrate_schema():
                     pass
         if "created_at" not in cols:
             conn.exec_driver_sql("ALTER TABLE entries ADD COLUMN created_at TEXT")
+        _normalise_entry_timestamps(conn)
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_entries_client_key ON entries (client_key)"
+        )
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_entries_completed_start"
+            " ON entries (completed, start_iso)"
+        )
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_entries_invoice ON entries (invoice_number)"
+            " WHERE invoice_number IS NOT NULL"
+        )
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_entries_start_iso ON entries (start_iso)"
+        )
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_entries_open"
+            " ON entries (client, client_key, id) WHERE end_iso IS NULL"
+        )
+        _FTS_ENABLED = _ensure_entries_fts(conn)
+        conn.exec_driver_sql(
+            "INSERT OR REPLACE INTO meta (k, v) VALUES ('schema_version', ?), ('fts', ?)",
+            (str(_SCHEMA_VERSION), "1" if _FTS_ENABLED else "0"),
+        )
 
 
 migrate_schema()
 
 # ---------- Roster lookup (client -> client_key) ----------
+# Loaded on first lookup and re-read whenever the file's mtime changes, so
+# roster edits apply without a restart. Until a roster exists, each lookup
+# re-checks the candidate paths.
 _ROSTER_MAP: Dict[str, str] = {}
+_ROSTER_PATH: Optional[Path] = None
+_ROSTER_MTIME: Optional[int] = None
 
 
-def _load_roster() -> Dict[str, str]:
-    paths = [
+def _find_roster() -> Optional[tuple[Path, int]]:
+    for p in [
         BASE_DIR / "roster.json",
         BASE_DIR / "app" / "roster.json",
         DATA_DIR / "roster.json",
-    ]
-    for p in paths:
-        if p.exists():
-            try:
-                raw = json.loads(p.read_text(encoding="utf-8"))
-                mapping: Dict[str, str] = {}
-                if (
-                    isinstance(raw, dict)
-                    and "clients" in raw
-                    and isinstance(raw["clients"], list)
-                ):
-                    for item in raw["clients"]:
-                        if isinstance(item, dict) and "name" in item and "key" in item:
-                            mapping[item["name"].strip().lower()] = str(
-                                item["key"]
-                            ).strip()
-                elif isinstance(raw, dict):
-                    for name, key in raw.items():
-                        mapping[str(name).strip().lower()] = str(key).strip()
-                return mapping
-            except Exception:
-                return {}
-    return {}
+    ]:
+        try:
+            return p, p.stat().st_mtime_ns
+        except OSError:
+            continue
+    return None
 
 
-def lookup_key_for_client(client_name: str) -> Optional[str]:
-    if not client_name:
-        return None
+def _load_roster(p: Path) -> Dict[str, str]:
+    try:
+        raw = orjson.loads(p.read_bytes())
+        mapping: Dict[str, str] = {}
+        if (
+            isinstance(raw, dict)
+            and "clients" in raw
+            and isinstance(raw["clients"], list)
+        ):
+            for item in raw["clients"]:
+                if isinstance(item, dict) and "name" in item and "key" in item:
+                    mapping[item["name"].strip().lower()] = str(item["key"]).strip()
+        elif isinstance(raw, dict):
+            for name, key in raw.items():
+                mapping[str(name).strip().lower()] = str(key).strip()
+        return mapping
+    except Exception:
+        return {}
+
+
+def _ensure_roster() -> None:
+    global _ROSTER_MAP, _ROSTER_PATH, _ROSTER_MTIME
+    found: Optional[tuple[Path, int]] = None
+    if _ROSTER_PATH is not None:
+        try:
+            found = _ROSTER_PATH, _ROSTER_PATH.stat().st_mtime_ns
+        except OSError:
+            pass
+    if found is None:
+        found = _find_roster()
+    path, mtime = found if found else (None, None)
+    if path == _ROSTER_PATH and mtime == _ROSTER_MTIME:
+        return
+    _ROSTER_MAP = _load_roster(path) if path else {}
+    _ROSTER_PATH, _ROSTER_MTIME = path, mtime
+    _roster_key.cache_clear()
+
+
+@lru_cache(maxsize=1024)
+def _roster_key(client_name: str) -> Optional[str]:
     return _ROSTER_MAP.get(client_name.strip().lower()) or None
 
 
-_ROSTER_MAP = _load_roster()
+def lookup_key_for_client(client_name: str) -> Optional[str]:
+    if not client_name:
+        return None
+    _ensure_roster()
+    return _roster_key(client_name)
 
 
 # ---------- Clients table JSON (client_table.json) ----------
@@ -180,34 +326,71 @@ def _client_table_path() -> Path:
     return BASE_DIR / "client_table.json"
 
 
+# Parsed client_table.json keyed by path and file identity; callers must not
+# mutate it. mtime alone can repeat on coarse-timestamp filesystems, but every
+# os.replace() gives the file a new inode.
+_clients_cache: Optional[
+    tuple[Path, tuple[int, int, int], Dict[str, Dict[str, Any]]]
+] = None
+
+
+def _file_key(st: os.stat_result) -> tuple[int, int, int]:
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
 def load_clients_json() -> Dict[str, Dict[str, Any]]:
+    global _clients_cache
     p = _client_table_path()
-    if not p.exists():
+    try:
+        key = _file_key(p.stat())
+    except OSError:
         return {}
+    if _clients_cache and _clients_cache[:2] == (p, key):
+        return _clients_cache[2]
     try:
-        data = json.loads(p.read_text(encoding="utf-8"))
+        data = orjson.loads(p.read_bytes())
         # enforce dict[str, dict]
         out: Dict[str, Dict[str, Any]] = {}
         if isinstance(data, dict):
             for k, v in data.items():
                 out[str(k)] = v if isinstance(v, dict) else {"value": v}
-        return out
     except Exception:
         return {}
+    _clients_cache = (p, key, out)
+    return out
+
+
+# Serialises read-modify-write cycles on client_table.json within a process.
+_clients_lock = threading.Lock()
 
 
 def save_clients_json(payload: Dict[str, Dict[str, Any]]) -> None:
+    global _clients_cache
+    _clients_cache = None
     p = _client_table_path()
-    p.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    # Per-process temp name: _clients_lock only serialises writers within one
+    # worker, and gunicorn runs several.
+    tmp = p.with_name(f"{p.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        # Stat before the swap: the rename keeps this inode's key, while
+        # stat'ing p afterwards could see another worker's newer file.
+        key = _file_key(tmp.stat())
+        # Atomic swap so concurrent readers never see a half-written file.
+        os.replace(tmp, p)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    # We just wrote exactly this; seed the cache instead of re-reading it.
+    _clients_cache = (p, key, payload)
 
 
 # ---------- Helpers ----------
 def get_db():
-    db = SessionLocal()
-    try:
+    # One plain Session per request; Session construction is cheap and the
+    # expensive part (the DBAPI connection) is already pooled by the engine.
+    with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 API_TOKEN = settings.api_token.strip()
@@ -220,26 +403,74 @@ def require_token(authorization: str = Header("")):
     raise HTTPException(401, "Unauthorized")
 
 
-def parse_iso(s: str) -> datetime:
-    return datetime.fromisoformat(s).astimezone(CENTRAL)
+_DATE_FMTS = ("%m/%d/%Y", "%m/%d/%y")
+_TIME_FMTS = ("%I:%M%p", "%I%p", "%H:%M", "%H%M", "%H")
+_TIME_RE = re.compile(r"^(\d{1,2})(?::(\d{2}))?\s*([ap]m)?$", re.IGNORECASE)
+
+
+def parse_date_mdy(s: str) -> date:
+    t = s.strip()
+    for fmt in _DATE_FMTS:
+        try:
+            return datetime.strptime(t, fmt).date()
+        except ValueError:
+            pass
+    raise HTTPException(400, "Invalid date; use mm/dd/yyyy")
+
+
+def parse_time_flexible(s: str) -> time:
+    t = s.strip()
+    # Fast path for "4", "4pm", "4:30 PM", "16:30" without touching strptime.
+    # Bare one/two-digit input is an hour: "16" -> 16:00, "09" -> 09:00
+    # (strptime's "%H%M" used to read those as 01:06 and 00:09).
+    m = _TIME_RE.match(t)
+    if m:
+        hour, minute, ampm = int(m.group(1)), int(m.group(2) or 0), m.group(3)
+        if ampm and 1 <= hour <= 12:
+            hour = hour % 12 + (12 if ampm.lower() == "pm" else 0)
+        elif ampm:
+            hour = -1  # "0am", "13pm": leave it to strptime to reject
+        if 0 <= hour <= 23 and 0 <= minute <= 59:
+            return time(hour, minute)
+    compact = t.replace(" ", "")
+    for fmt in _TIME_FMTS:
+        try:
+            return datetime.strptime(compact, fmt).time()
+        except ValueError:
+            pass
+    raise HTTPException(400, "Invalid time; e.g. 4:30 PM, 4 PM, 16:30")
 
 
 def now_local() -> datetime:
     return datetime.now(tz=CENTRAL)
 
 
+_SAFE_KEY_RE = re.compile(r"[^a-z0-9\-]+")
+
+
+@lru_cache(maxsize=1024)
 def safe_client_key(client: str) -> str:
-    return re.sub(r"[^a-z0-9\-]+", "-", client.lower()).strip("-")
+    return _SAFE_KEY_RE.sub("-", client.lower()).strip("-")
+
+
+_ONE_MINUTE = timedelta(minutes=1)
 
 
 def compute_minutes(start: datetime, end: datetime) -> tuple[int, int, str]:
-    mins = int((end - start).total_seconds() // 60)
-    rounded = max(0, int(round(mins / 15.0) * 15))
-    hrs = f"{(rounded/60.0):.2f}"
-    return mins, rounded, hrs
+    # Subtract in UTC: two datetimes sharing the CENTRAL tzinfo subtract as wall
+    # clock time, which is an hour off across a DST change.
+    # All-integer: timedelta // timedelta floors exactly, and a whole number of
+    # minutes never sits on a .5 quarter boundary, so (m + 7) // 15 == round().
+    mins = (
+        end.astimezone(timezone.utc) - start.astimezone(timezone.utc)
+    ) // _ONE_MINUTE
+    rounded = (mins + 7) // 15 * 15 if mins > 0 else 0
+    whole, rem = divmod(rounded, 60)
+    return mins, rounded, f"{whole}.{rem * 100 // 60:02d}"
 
 
 # ---------- Jinja filters (m/d/yy HH:MM am/pm) ----------
+@lru_cache(maxsize=4096)
 def fmt_dt(s: str | None) -> str:
     if not s:
         return "—"
@@ -276,8 +507,17 @@ class SessionStop(BaseModel):
     note: Optional[str] = None
 
 
+# ---------- Serialisation ----------
+_ENTRY_COLS = tuple(Entry.__table__.columns.keys())
+_entry_values = attrgetter(*_ENTRY_COLS)
+
+
+def _entry_dict(r: Entry) -> Dict[str, Any]:
+    return dict(zip(_ENTRY_COLS, _entry_values(r)))
+
+
 # ---------- Query helpers ----------
-def _fetch_rows(
+def _entries_query(
     db: Session,
     client: str | None,
     client_key: str | None,
@@ -297,7 +537,17 @@ def _fetch_rows(
         qry = qry.filter(Entry.completed == 0)
     if status == "done":
         qry = qry.filter(Entry.completed == 1)
-    if qtext:
+    if qtext and _FTS_ENABLED and len(qtext) >= 3:
+        # Quoted so user input is a literal trigram phrase, not FTS5 syntax.
+        phrase = '"' + qtext.replace('"', '""') + '"'
+        qry = qry.filter(
+            Entry.id.in_(
+                select(_entries_fts.c.rowid).where(
+                    _entries_fts.c.entries_fts.op("MATCH")(phrase)
+                )
+            )
+        )
+    elif qtext:
         like = f"%{qtext}%"
         qry = qry.filter(
             or_(
@@ -314,28 +564,40 @@ def _fetch_rows(
         except Exception:
             return None
 
+    # start_iso is local ISO-8601 text, so a date prefix compares
+    # chronologically and the range runs on ix_entries_start_iso.
     sdate = _to_date(since) if since else None
     udate = _to_date(until) if until else None
-
-    rows = qry.order_by(Entry.id.desc()).limit(limit * 5).all()
-    out: list[Entry] = []
-    for r in rows:
-        d = parse_iso(r.start_iso).date()
-        if sdate and d < sdate:
-            continue
-        if udate and d > udate:
-            continue
-        out.append(r)
+    if sdate:
+        qry = qry.filter(Entry.start_iso >= sdate.isoformat())
+    if udate:
+        qry = qry.filter(Entry.start_iso < (udate + timedelta(days=1)).isoformat())
 
     if sort == "id_asc":
-        out.sort(key=lambda r: r.id)
+        qry = qry.order_by(Entry.id.asc())
     elif sort == "start_asc":
-        out.sort(key=lambda r: r.start_iso)
+        qry = qry.order_by(Entry.start_iso.asc(), Entry.id.desc())
     elif sort == "start_desc":
-        out.sort(key=lambda r: r.start_iso, reverse=True)
+        qry = qry.order_by(Entry.start_iso.desc(), Entry.id.desc())
     else:  # "open_first_newest"
-        out.sort(key=lambda r: (r.completed, -r.id))
-    return out[:limit]
+        qry = qry.order_by(Entry.completed.asc(), Entry.id.desc())
+    return qry.limit(limit)
+
+
+def _fetch_rows(
+    db: Session,
+    client: str | None,
+    client_key: str | None,
+    status: str | None,
+    qtext: str | None,
+    since: str | None,
+    until: str | None,
+    sort: str,
+    limit: int,
+) -> List[Entry]:
+    return _entries_query(
+        db, client, client_key, status, qtext, since, until, sort, limit
+    ).all()
 
 
 # ---------- UI ----------
@@ -399,7 +661,6 @@ def ui_toggle_completed(entry_id: int, db: Session = Depends(get_db)):
         raise HTTPException(404, "Not found")
     r.completed = 0 if r.completed else 1
     db.commit()
-    db.refresh(r)
     return templates.TemplateResponse("_rows.html", {"request": {}, "rows": [r]})
 
 
@@ -412,7 +673,6 @@ def ui_set_invoice(
         raise HTTPException(404, "Not found")
     r.invoice_number = (invoice_number or "").strip() or None
     db.commit()
-    db.refresh(r)
     return templates.TemplateResponse("_rows.html", {"request": {}, "rows": [r]})
 
 
@@ -439,31 +699,6 @@ def ui_manual(
 ):
     ck = client_key or lookup_key_for_client(client) or safe_client_key(client)
 
-    def parse_date_mdy(s: str) -> date:
-        t = s.strip()
-        for fmt in ("%m/%d/%Y", "%-m/%-d/%Y", "%m/%d/%y"):
-            try:
-                return datetime.strptime(t, fmt).date()
-            except ValueError:
-                pass
-        raise HTTPException(400, "Invalid date; use mm/dd/yyyy")
-
-    def parse_time_flexible(s: str) -> time:
-        t = s.strip()
-        for fmt in ("%I:%M %p", "%I %p", "%I:%M%p", "%I%p", "%H:%M", "%H%M", "%H"):
-            try:
-                return datetime.strptime(
-                    t.replace(" ", ""), fmt.replace(" ", "")
-                ).time()
-            except ValueError:
-                pass
-        for fmt in ("%I:%M %p", "%I %p"):
-            try:
-                return datetime.strptime(t, fmt).time()
-            except ValueError:
-                pass
-        raise HTTPException(400, "Invalid time; e.g. 4:30 PM, 4 PM, 16:30")
-
     d = parse_date_mdy(date_str)
     t1 = parse_time_flexible(start_str)
     t2 = parse_time_flexible(end_str)
@@ -486,9 +721,8 @@ def ui_manual(
         completed=0,
         created_at=now_local().isoformat(),
     )
-    with SessionLocal() as s:
-        s.add(r)
-        s.commit()
+    db.add(r)
+    db.commit()
     return RedirectResponse(url="/", status_code=302)
 
 
@@ -497,15 +731,15 @@ async def ui_import(csvfile: UploadFile = File(...), db: Session = Depends(get_d
     content = await csvfile.read()
     text = content.decode("utf-8", errors="ignore")
     reader = csv.DictReader(io.StringIO(text))
+    rows: List[Dict[str, Any]] = []
     for row in reader:
         client = row.get("client") or row.get("Client") or ""
         if not client:
             continue
-        roster_key = lookup_key_for_client(client)
         client_key = (
             row.get("client_key")
             or row.get("Client Key")
-            or roster_key
+            or lookup_key_for_client(client)
             or safe_client_key(client)
         )
         start_iso = (
@@ -515,33 +749,55 @@ async def ui_import(csvfile: UploadFile = File(...), db: Session = Depends(get_d
         note = row.get("note") or row.get("Note") or ""
         completed = int(row.get("completed") or row.get("Completed") or 0)
         invoice = row.get("invoice_number") or row.get("Invoice") or None
-        r = Entry(
-            client=client,
-            client_key=client_key,
-            start_iso=start_iso,
-            end_iso=end_iso,
-            note=note,
-            completed=completed,
-            invoice_number=invoice,
-        )
+        mins, rmin, rhrs = 0, 0, "0.00"
+        # Store Central-time ISO strings: listings range-filter on the raw text.
         try:
+            sdt = parse_iso(start_iso)
+            start_iso = sdt.isoformat()
             if end_iso:
-                sdt, edt = parse_iso(start_iso), parse_iso(end_iso)
+                edt = parse_iso(end_iso)
+                end_iso = edt.isoformat()
                 mins, rmin, rhrs = compute_minutes(sdt, edt)
-                r.minutes, r.rounded_minutes, r.rounded_hours = mins, rmin, rhrs
-                r.elapsed_minutes = mins
-            else:
-                r.minutes, r.rounded_minutes, r.rounded_hours = 0, 0, "0.00"
-                r.elapsed_minutes = 0
         except Exception:
-            r.minutes, r.rounded_minutes, r.rounded_hours = 0, 0, "0.00"
-            r.elapsed_minutes = 0
-        db.add(r)
+            mins, rmin, rhrs = 0, 0, "0.00"
+        rows.append(
+            {
+                "client": client,
+                "client_key": client_key,
+                "start_iso": start_iso,
+                "end_iso": end_iso,
+                "minutes": mins,
+                "rounded_minutes": rmin,
+                "rounded_hours": rhrs,
+                "elapsed_minutes": mins,
+                "note": note,
+                "completed": completed,
+                "invoice_number": invoice,
+            }
+        )
+    bulk_insert(db, Entry.__table__, rows)
     db.commit()
     return RedirectResponse(url="/", status_code=302)
 
 
 # ---------- CSV Export ----------
+_EXPORT_COLS = (
+    "id",
+    "client",
+    "client_key",
+    "start_iso",
+    "end_iso",
+    "minutes",
+    "rounded_minutes",
+    "rounded_hours",
+    "note",
+    "completed",
+    "invoice_number",
+    "created_at",
+)
+_EXPORT_FIELDS = tuple(getattr(Entry, c) for c in _EXPORT_COLS)
+
+
 @app.get("/api/export.csv")
 def export_csv(
     client: str | None = None,
@@ -552,54 +808,41 @@ def export_csv(
     q: str | None = None,
     sort: str = "open_first_newest",
     limit: int = 500,
-    db: Session = Depends(get_db),
 ):
     status = None
     if completed == "0":
         status = "open"
     if completed == "1":
         status = "done"
-    rows = _fetch_rows(db, client, client_key, status, q, since, until, sort, limit)
 
-    buf = io.StringIO(newline="")
-    w = csv.writer(buf)
-    w.writerow(
-        [
-            "id",
-            "client",
-            "client_key",
-            "start_iso",
-            "end_iso",
-            "minutes",
-            "rounded_minutes",
-            "rounded_hours",
-            "note",
-            "completed",
-            "invoice_number",
-            "created_at",
-        ]
+    def _iter_csv():
+        buf = io.StringIO(newline="")
+        w = csv.writer(buf)
+
+        def _flush() -> str:
+            chunk = buf.getvalue()
+            buf.seek(0)
+            buf.truncate(0)
+            return chunk
+
+        w.writerow(_EXPORT_COLS)
+        yield _flush()
+        # The generator runs after the endpoint returns, so it owns its session.
+        with SessionLocal() as db:
+            qry = _entries_query(
+                db, client, client_key, status, q, since, until, sort, limit
+            )
+            # Plain column tuples (csv writes None as ""), one writerows per chunk.
+            rows = iter(qry.with_entities(*_EXPORT_FIELDS).yield_per(500))
+            while batch := list(islice(rows, 500)):
+                w.writerows(batch)
+                yield _flush()
+
+    return StreamingResponse(
+        _iter_csv(),
+        media_type="text/csv",
+        headers={"Content-Disposition": "attachment; filename=tracker-export.csv"},
     )
-    for r in rows:
-        w.writerow(
-            [
-                r.id,
-                r.client,
-                r.client_key,
-                r.start_iso,
-                r.end_iso,
-                r.minutes,
-                r.rounded_minutes,
-                r.rounded_hours,
-                r.note or "",
-                r.completed,
-                r.invoice_number or "",
-                r.created_at,
-            ]
-        )
-    text = buf.getvalue()
-    resp = Response(text, media_type="text/csv")
-    resp.headers["Content-Disposition"] = "attachment; filename=tracker-export.csv"
-    return resp
 
 
 # ---------- JSON API: patch single entry ----------
@@ -616,16 +859,16 @@ def patch_entry(entry_id: int, payload: PatchEntry, db: Session = Depends(get_db
         r.note = payload.note.strip()
     db.commit()
     db.refresh(r)
-    return {k: getattr(r, k) for k in r.__table__.columns.keys()}
+    return _entry_dict(r)
 
 
 # ---------- JSON API: get single entry (UI helper) ----------
-@app.get("/api/entries/{entry_id}", response_class=JSONResponse)
+@app.get("/api/entries/{entry_id}", response_class=ORJSONResponse)
 def get_entry(entry_id: int, db: Session = Depends(get_db)):
     r = db.get(Entry, entry_id)
     if not r:
         raise HTTPException(404, "Not found")
-    return {k: getattr(r, k) for k in r.__table__.columns.keys()}
+    return _entry_dict(r)
 
 
 # ---------- UI: edit entry from modal ----------
@@ -653,11 +896,14 @@ def ui_edit_entry(
     r.invoice_number = (invoice_number or "").strip() or None
     r.completed = 1 if (completed and completed not in ("0", "false", "False")) else 0
 
-    # recompute minutes if both timestamps are present
+    # normalise to Central time and recompute minutes if both are present
     try:
-        if r.start_iso and r.end_iso:
+        if r.start_iso:
             sdt = parse_iso(r.start_iso)
+            r.start_iso = sdt.isoformat()
+        if r.start_iso and r.end_iso:
             edt = parse_iso(r.end_iso)
+            r.end_iso = edt.isoformat()
             mins, rmin, rhrs = compute_minutes(sdt, edt)
             r.minutes, r.rounded_minutes, r.rounded_hours = mins, rmin, rhrs
             r.elapsed_minutes = mins
@@ -680,28 +926,33 @@ def api_sessions_start(
     client_key = (payload.client_key or derived_key or safe_client_key(client)).strip()
     note = (payload.note or "").strip()
 
-    r = Entry(
-        client=client,
-        client_key=client_key,
-        start_iso=now_local().isoformat(),
-        end_iso=None,
-        minutes=0,
-        rounded_minutes=0,
-        rounded_hours="0.00",
-        elapsed_minutes=0,
-        note=note,
-        completed=0,
-        created_at=now_local().isoformat(),
+    start_iso = now_local().isoformat()
+    (entry_id,) = fast_insert(
+        db,
+        Entry.__table__,
+        [
+            {
+                "client": client,
+                "client_key": client_key,
+                "start_iso": start_iso,
+                "end_iso": None,
+                "minutes": 0,
+                "rounded_minutes": 0,
+                "rounded_hours": "0.00",
+                "elapsed_minutes": 0,
+                "note": note,
+                "completed": 0,
+                "created_at": now_local().isoformat(),
+            }
+        ],
     )
-    db.add(r)
     db.commit()
-    db.refresh(r)
     return {
         "status": "started",
-        "entry_id": r.id,
-        "client": r.client,
-        "client_key": r.client_key,
-        "start_iso": r.start_iso,
+        "entry_id": entry_id,
+        "client": client,
+        "client_key": client_key,
+        "start_iso": start_iso,
     }
 
 
@@ -715,27 +966,58 @@ def api_sessions_stop(
     derived_key = lookup_key_for_client(client)
     client_key = payload.client_key or derived_key
 
-    q = db.query(Entry).filter(Entry.client == client, Entry.end_iso.is_(None))
+    # Core statements only: read the open row's start and note, then close it
+    # with a guarded UPDATE ... RETURNING in the same transaction.
+    q = (
+        select(Entry.id, Entry.start_iso, Entry.note)
+        .where(Entry.client == client, Entry.end_iso.is_(None))
+        .order_by(desc(Entry.id))
+        .limit(1)
+    )
     if client_key:
-        q = q.filter(Entry.client_key == client_key)
-    r = q.order_by(desc(Entry.id)).first()
-    if not r:
+        q = q.where(Entry.client_key == client_key)
+    open_row = db.execute(q).first()
+    if not open_row:
         raise HTTPException(404, "No active session to stop")
 
+    entry_id, start_iso, note = open_row
     end = now_local()
-    sdt = parse_iso(r.start_iso)
-    r.end_iso = end.isoformat()
-    mins, rmin, rhrs = compute_minutes(sdt, end)
-    r.minutes, r.rounded_minutes, r.rounded_hours = mins, rmin, rhrs
-    r.elapsed_minutes = mins
+    mins, rmin, rhrs = compute_minutes(parse_iso(start_iso), end)
     if payload.note and payload.note.strip():
-        r.note = (
-            (r.note + ("\n" if r.note else "") + payload.note.strip())
-            if r.note
+        note = (
+            (note + ("\n" if note else "") + payload.note.strip())
+            if note
             else payload.note.strip()
         )
+    entries = Entry.__table__
+    r = db.execute(
+        update(entries)
+        .where(entries.c.id == entry_id, entries.c.end_iso.is_(None))
+        .values(
+            end_iso=end.isoformat(),
+            minutes=mins,
+            rounded_minutes=rmin,
+            rounded_hours=rhrs,
+            elapsed_minutes=mins,
+            note=note,
+        )
+        .returning(
+            entries.c.id,
+            entries.c.client,
+            entries.c.client_key,
+            entries.c.start_iso,
+            entries.c.end_iso,
+            entries.c.minutes,
+            entries.c.rounded_minutes,
+            entries.c.rounded_hours,
+            entries.c.note,
+        )
+    ).first()
+    if r is None:
+        # Stopped by a concurrent request between the SELECT and the UPDATE.
+        db.rollback()
+        raise HTTPException(404, "No active session to stop")
     db.commit()
-    db.refresh(r)
 
     return {
         "status": "stopped",
@@ -779,7 +1061,7 @@ def api_sessions_active(
 
 
 # ---------- Clients JSON API ----------
-@app.get("/api/clients", response_class=JSONResponse)
+@app.get("/api/clients", response_class=ORJSONResponse)
 def api_clients_list():
     data = load_clients_json()
     # Build dynamic column set for UI convenience
@@ -789,7 +1071,7 @@ def api_clients_list():
     return {"clients": data, "columns": sorted(columns)}
 
 
-@app.get("/api/clients/{client_name}", response_class=JSONResponse)
+@app.get("/api/clients/{client_name}", response_class=ORJSONResponse)
 def api_clients_get(client_name: str):
     data = load_clients_json()
     if client_name not in data:
@@ -797,21 +1079,21 @@ def api_clients_get(client_name: str):
     return {"name": client_name, "attributes": data[client_name]}
 
 
-@app.post("/api/clients/{client_name}", response_class=JSONResponse)
+@app.post("/api/clients/{client_name}", response_class=ORJSONResponse)
 def api_clients_upsert(client_name: str, payload: Dict[str, Any]):
-    data = load_clients_json()
-    existing = data.get(client_name, {})
-    if not isinstance(existing, dict):
-        existing = {}
-    # Merge/replace keys from payload
-    for k, v in payload.items():
-        existing[k] = v
-    data[client_name] = existing
-    save_clients_json(data)
+    with _clients_lock:
+        data = dict(load_clients_json())
+        existing = data.get(client_name, {})
+        existing = dict(existing) if isinstance(existing, dict) else {}
+        # Merge/replace keys from payload
+        for k, v in payload.items():
+            existing[k] = v
+        data[client_name] = existing
+        save_clients_json(data)
     return {"ok": True, "name": client_name, "attributes": existing}
 
 
-@app.post("/api/clients", response_class=JSONResponse)
+@app.post("/api/clients", response_class=ORJSONResponse)
 def api_clients_create(payload: Dict[str, Any]):
     name = payload.get("name", "").strip()
     if not name:
@@ -819,11 +1101,12 @@ def api_clients_create(payload: Dict[str, Any]):
     attrs = payload.get("attributes") or {}
     if not isinstance(attrs, dict):
         attrs = {}
-    data = load_clients_json()
-    if name in data:
-        raise HTTPException(409, "Client already exists")
-    data[name] = attrs
-    save_clients_json(data)
+    with _clients_lock:
+        data = dict(load_clients_json())
+        if name in data:
+            raise HTTPException(409, "Client already exists")
+        data[name] = attrs
+        save_clients_json(data)
     return {"ok": True, "name": name, "attributes": attrs}
 
 
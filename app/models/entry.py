@@ -1,23 +1,51 @@
 from datetime import datetime
+from decimal import Decimal
+from typing import Any, Optional
 
-from sqlalchemy import Column, Integer, Text
+from sqlalchemy import Column, Index, Integer, Numeric, Text, text
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
 
 from app.core.timezone import CENTRAL
 from app.db.base import Base
 
 
+class Hours(TypeDecorator[str]):
+    """NUMERIC(10, 2) column that still reads and writes "1.25"-style strings."""
+
+    impl = Numeric(10, 2, asdecimal=False)
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Optional[Decimal]:
+        if value is None:
+            return None
+        return Decimal(str(value))
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return f"{Decimal(str(value)):.2f}"
+
+
 class Entry(Base):
     __tablename__ = "entries"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    # Plain INTEGER PRIMARY KEY: on SQLite this aliases the rowid. Don't add
+    # sqlite_autoincrement, which would maintain sqlite_sequence on every insert.
+    id = Column(Integer, primary_key=True)
     client = Column(Text, nullable=False)
     client_key = Column(Text, nullable=False)
+    # ISO-8601 local (America/Chicago) timestamps: all writers convert to
+    # Central time, and rows from older builds are rewritten once (SQLite
+    # migrate_schema v2 / revision 5c3d9e1f7a20). Only values that fail to
+    # parse are kept as given. The fixed-width date/time prefix sorts
+    # chronologically as text, so range filters and indexes work on the string.
     start_iso = Column(Text, nullable=False)
     end_iso = Column(Text, nullable=True)
 
     minutes = Column(Integer, nullable=False, default=0)
     rounded_minutes = Column(Integer, nullable=False, default=0)
-    rounded_hours = Column(Text, nullable=False, default="0.00")
+    rounded_hours = Column(Hours, nullable=False, default="0.00")
     elapsed_minutes = Column(Integer, nullable=False, default=0)
 
     note = Column(Text, nullable=True)
@@ -27,5 +55,26 @@ class Entry(Base):
         Text, nullable=False, default=lambda: datetime.now(tz=CENTRAL).isoformat()
     )
 
+    __table_args__ = (
+        Index("ix_entries_client_key", "client_key"),
+        Index("ix_entries_completed_start", "completed", "start_iso"),
+        Index("ix_entries_start_iso", "start_iso"),
+        # Open sessions only: stays tiny no matter how much history accrues.
+        Index(
+            "ix_entries_open",
+            "client",
+            "client_key",
+            "id",
+            postgresql_where=text("end_iso IS NULL"),
+            sqlite_where=text("end_iso IS NULL"),
+        ),
+        Index(
+            "ix_entries_invoice",
+            "invoice_number",
+            postgresql_where=text("invoice_number IS NOT NULL"),
+            sqlite_where=text("invoice_number IS NOT NULL"),
+        ),
+    )
+
 
 __all__ = ["Entry"]
@@ -0,0 +1,5 @@
+import os
+
+# app.main connects to the database and migrates it at import time; point it
+# at a private in-memory SQLite database instead of whatever .env configures.
+os.environ["DB_URL"] = "sqlite://"
@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.timezone import CENTRAL, parse_iso
+from app.main import compute_minutes
+
+START = datetime(2025, 1, 6, 9, 0, tzinfo=CENTRAL)
+
+
+@pytest.mark.parametrize(
+    "elapsed, minutes, rounded, hours",
+    [
+        (timedelta(0), 0, 0, "0.00"),
+        (timedelta(minutes=7), 7, 0, "0.00"),
+        (timedelta(minutes=7, seconds=59), 7, 0, "0.00"),
+        (timedelta(minutes=8), 8, 15, "0.25"),
+        (timedelta(minutes=22), 22, 15, "0.25"),
+        (timedelta(minutes=23), 23, 30, "0.50"),
+        (timedelta(minutes=45), 45, 45, "0.75"),
+        (timedelta(minutes=67), 67, 60, "1.00"),
+        (timedelta(minutes=68), 68, 75, "1.25"),
+        (timedelta(hours=10, minutes=5), 605, 600, "10.00"),
+        # negative durations floor like the seconds // 60 they replaced
+        (timedelta(seconds=-30), -1, 0, "0.00"),
+        (timedelta(minutes=-30), -30, 0, "0.00"),
+    ],
+)
+def test_compute_minutes(elapsed, minutes, rounded, hours):
+    assert compute_minutes(START, START + elapsed) == (minutes, rounded, hours)
+
+
+@pytest.mark.parametrize(
+    "start, end, minutes",
+    [
+        # spring forward: 01:30 CST -> 03:30 CDT is one real hour
+        ("2025-03-09T01:30:00-06:00", "2025-03-09T03:30:00-05:00", 60),
+        # fall back: 00:30 CDT -> 01:30 CST is two real hours
+        ("2025-11-02T00:30:00-05:00", "2025-11-02T01:30:00-06:00", 120),
+    ],
+)
+def test_compute_minutes_across_dst(start, end, minutes):
+    assert compute_minutes(parse_iso(start), parse_iso(end))[0] == minutes
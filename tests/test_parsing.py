@@ -0,0 +1,42 @@
+from datetime import time
+
+import pytest
+from fastapi import HTTPException
+
+from app.main import parse_time_flexible
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        # _TIME_RE fast path
+        ("4", time(4, 0)),
+        ("4pm", time(16, 0)),
+        ("4 PM", time(16, 0)),
+        ("4:30 PM", time(16, 30)),
+        ("4:30pm", time(16, 30)),
+        (" 7:15 am ", time(7, 15)),
+        ("16:30", time(16, 30)),
+        ("09:05", time(9, 5)),
+        # bare one/two-digit input is an hour (strptime's %H%M read "16" as 01:06)
+        ("16", time(16, 0)),
+        ("09", time(9, 0)),
+        # midnight and noon
+        ("12am", time(0, 0)),
+        ("12:30 AM", time(0, 30)),
+        ("12pm", time(12, 0)),
+        ("12:45 PM", time(12, 45)),
+        # strptime fallback
+        ("930", time(9, 30)),
+        ("1630", time(16, 30)),
+    ],
+)
+def test_parse_time_flexible(raw, expected):
+    assert parse_time_flexible(raw) == expected
+
+
+@pytest.mark.parametrize("raw", ["0am", "13pm", "24:00", "12:60", "", "noon"])
+def test_parse_time_flexible_rejects(raw):
+    with pytest.raises(HTTPException) as exc:
+        parse_time_flexible(raw)
+    assert exc.value.status_code == 400